@@ -1,13 +1,26 @@
-import logging, pkg_resources
+import asyncio, logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from json.decoder import JSONDecodeError
-from typing import Union
+from importlib.metadata import version, PackageNotFoundError
+from typing import List, Union
 from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 
 try:
-    __version__ = pkg_resources.get_distribution("nagerapi").version
-except pkg_resources.DistributionNotFound:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    __version__ = version("nagerapi")
+except PackageNotFoundError:
     __version__ = ""
 __author__ = "Nathan Taggart"
 __credits__ = "meisnate12"
@@ -17,24 +30,54 @@ __description__ = "Python wrapper for Nager API https://date.nager.at/Api"
 __url__ = "https://github.com/meisnate12/NagerAPI"
 __email__ = 'meisnate12@gmail.com'
 __license__ = 'MIT License'
-__all__ = ["NagerObjectAPI", "NagerRawAPI", "NagerException", "Country", "Weekend", "Holiday"]
+__all__ = ["NagerObjectAPI", "NagerRawAPI", "NagerAsyncRawAPI", "NagerException", "Country", "Weekend", "Holiday"]
 base_url = "https://date.nager.at/api/v3/"
+_country_info_url = f"{base_url}CountryInfo/"
+_available_countries_url = f"{base_url}AvailableCountries"
+_long_weekend_url = f"{base_url}LongWeekend/"
+_public_holidays_url = f"{base_url}PublicHolidays/"
+_is_today_public_holiday_url = f"{base_url}IsTodayPublicHoliday/"
+_next_public_holidays_url = f"{base_url}NextPublicHolidays/"
+_next_public_worldwide_holidays_url = f"{base_url}NextPublicHolidaysWorldwide"
+_version_url = f"{base_url}Version"
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_date(date_str):
+    """ Parses a YYYY-MM-DD string into a datetime. """
+    return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10])) if date_str else None
+
+
+
+def _process_response(request_url, status_code, reason, content):
+    """ Decodes the response JSON and raises a :class:`NagerException` for error statuses. """
+    try:
+        response_json = _loads(content)
+    except ValueError as e:
+        raise NagerException(f"Failed to Decode Response JSON{request_url}: {e}\nContent: {content}")
+    logger.debug(f"Response ({status_code} [{reason}]) {response_json}")
+
+    if status_code == 404:
+        raise NagerException(f"({status_code} [{reason}]) Country Code Invalid")
+    elif status_code >= 400:
+        raise NagerException(f"({status_code} [{reason}]) {response_json}")
+    return response_json
+
 class NagerException(Exception):
     """ Base class for all Nagar exceptions. """
     pass
 
 
 class NagerBase:
+    __slots__ = ("_nager", "_loading")
+
     def __init__(self, nager):
-        self._nager = nager
-        self._loading = True
+        object.__setattr__(self, "_nager", nager)
+        object.__setattr__(self, "_loading", True)
 
     def __setattr__(self, key, value):
-        if key.startswith("_") or self._loading:
+        if self._loading or key.startswith("_"):
             super().__setattr__(key, value)
         else:
             raise AttributeError("Attributes cannot be edited")
@@ -42,6 +85,12 @@ class NagerBase:
     def __repr__(self):
         return self.__str__()
 
+    def __setstate__(self, state):
+        for attrs in state if isinstance(state, tuple) else (state,):
+            if attrs:
+                for key, value in attrs.items():
+                    object.__setattr__(self, key, value)
+
 
 class Weekend(NagerBase):
     """ Represents a single Long Weekend.
@@ -52,10 +101,12 @@ class Weekend(NagerBase):
             day_count (int): Days in the Long Weekend.
             need_bridge_day (bool): Is a Bridge Day needed for the Long Weekend.
     """
+    __slots__ = ("start_date", "end_date", "day_count", "need_bridge_day")
+
     def __init__(self, nager, data):
         super().__init__(nager)
-        self.start_date = datetime.strptime(data["startDate"], "%Y-%m-%d") if data["startDate"] else None
-        self.end_date = datetime.strptime(data["endDate"], "%Y-%m-%d") if data["endDate"] else None
+        self.start_date = _parse_date(data["startDate"])
+        self.end_date = _parse_date(data["endDate"])
         self.day_count = data["dayCount"]
         self.need_bridge_day = data["needBridgeDay"]
         self._loading = False
@@ -86,25 +137,47 @@ class Holiday(NagerBase):
             is_observance (bool): "Observance" type is in types.
 
     """
+    __slots__ = ("name", "local_name", "date", "code", "fixed_holiday", "global_holiday", "counties", "launch_year",
+                 "types", "is_public", "is_bank", "is_school", "is_authorities", "is_optional", "is_observance")
+    _type_flags = (("Public", "is_public"), ("Bank", "is_bank"), ("School", "is_school"),
+                   ("Authorities", "is_authorities"), ("Optional", "is_optional"), ("Observance", "is_observance"))
+
     def __init__(self, nager, data):
         super().__init__(nager)
-        self.name = data["name"]
-        self.local_name = data["localName"]
-        self.date = datetime.strptime(data["date"], "%Y-%m-%d") if data["date"] else None
-        self.code = data["countryCode"]
-        self.country = self._nager.country(self.code, load=False)
-        self.fixed_holiday = data["fixed"]
-        self.global_holiday = data["global"]
-        self.counties = data["counties"]
-        self.launch_year = data["launchYear"]
-        self.types = data["types"]
-        self.is_public = "Public" in self.types
-        self.is_bank = "Bank" in self.types
-        self.is_school = "School" in self.types
-        self.is_authorities = "Authorities" in self.types
-        self.is_optional = "Optional" in self.types
-        self.is_observance = "Observance" in self.types
-        self._loading = False
+        self._load(data)
+
+    def _load(self, data):
+        set_attr = object.__setattr__
+        set_attr(self, "name", data["name"])
+        set_attr(self, "local_name", data["localName"])
+        set_attr(self, "date", _parse_date(data["date"]))
+        set_attr(self, "code", data["countryCode"])
+        set_attr(self, "fixed_holiday", data["fixed"])
+        set_attr(self, "global_holiday", data["global"])
+        set_attr(self, "counties", data["counties"])
+        set_attr(self, "launch_year", data["launchYear"])
+        set_attr(self, "types", data["types"])
+        types = frozenset(data["types"])
+        for type_name, attr in self._type_flags:
+            set_attr(self, attr, type_name in types)
+        set_attr(self, "_loading", False)
+
+    @classmethod
+    def _from_batch(cls, nager, raws):
+        """ Builds a Holiday for each raw dict without going through __init__. """
+        new, set_attr, load = cls.__new__, object.__setattr__, cls._load
+        holidays = []
+        append = holidays.append
+        for data in raws:
+            holiday = new(cls)
+            set_attr(holiday, "_nager", nager)
+            load(holiday, data)
+            append(holiday)
+        return holidays
+
+    @property
+    def country(self):
+        return self._nager.country(self.code, load=False)
 
     def __str__(self):
         return f"{self.name} ({self.date.strftime('%Y-%m-%d')})"
@@ -121,6 +194,9 @@ class Country(NagerBase):
             borders (List[Country]): List of Counties the border the Country.
 
     """
+    __slots__ = ("name", "code", "official", "region", "borders", "_full", "_code_upper")
+    _detail_attrs = ("official", "region", "borders")
+
     def __init__(self, nager, data):
         super().__init__(nager)
         self._load(data)
@@ -129,27 +205,37 @@ class Country(NagerBase):
         self._loading = True
         self.name = data["name"] if "name" in data else data["commonName"]
         self.code = data["countryCode"]
-        self.official = data["officialName"] if "officialName" in data else None
-        self.region = data["region"] if "region" in data else None
-        self.borders = [Country(self._nager, c) for c in data["borders"]] if "borders" in data and data["borders"] else None
+        self._code_upper = self.code.upper() if self.code else None
         self._full = "region" in data
+        if self._full:
+            self.official = data["officialName"] if "officialName" in data else None
+            self.region = data["region"]
+            self.borders = [self._border(c) for c in data["borders"]] if "borders" in data and data["borders"] else None
         self._loading = False
 
+    def _border(self, data):
+        try:
+            return self._nager.country(data["countryCode"], load=False)
+        except NagerException:
+            return Country(self._nager, data)
+
     def __str__(self):
         return self.name
 
     def __eq__(self, other):
-        if type(self) is type(other):
-            return self.name == other.name and self.code == other.code
+        if isinstance(other, Country):
+            return self._code_upper == other._code_upper
         else:
-            return str(self.code) == str(other).upper()
+            return self._code_upper == str(other).upper()
+
+    def __hash__(self):
+        return hash(self._code_upper)
 
-    def __getattribute__(self, item):
-        value = super().__getattribute__(item)
-        if value is not None or self._full:
-            return value
+    def __getattr__(self, item):
+        if item not in self._detail_attrs or self._full:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{item}'")
         self.load_details()
-        return super().__getattribute__(item)
+        return object.__getattribute__(self, item)
 
     def load_details(self):
         """ Loads the details for the country. """
@@ -161,7 +247,7 @@ class Country(NagerBase):
 
     def public_holidays(self, year: int):
         """ Alias for :meth:`~NagerObjectAPI.public_holidays` for this country. """
-        return [Holiday(self._nager, h) for h in self._nager.api.get_public_holidays(year, self.code)]
+        return Holiday._from_batch(self._nager, self._nager.api.get_public_holidays(year, self.code))
 
     def is_today_public_holiday(self, offset: int = None):
         """ Alias for :meth:`~NagerObjectAPI.is_today_public_holiday` for this country. """
@@ -169,7 +255,7 @@ class Country(NagerBase):
 
     def next_public_holidays(self):
         """ Alias for :meth:`~NagerObjectAPI.next_public_holidays` for this country. """
-        return [Holiday(self._nager, h) for h in self._nager.api.get_next_public_holidays(self.code)]
+        return Holiday._from_batch(self._nager, self._nager.api.get_next_public_holidays(self.code))
 
 
 class NagerObjectAPI:
@@ -178,19 +264,22 @@ class NagerObjectAPI:
         Parameters:
             session (Session): Use your own Session object.
             default_country (Union[str, Country]): Default Country to use in any method where country isn't provided.
+            preload (bool): Load the Full Details of every available Country concurrently when they're first accessed.
 
         Attributes:
             name (str): Name of the API.
             version (int): Version of the API.
             default_country (Country): Default Country to use.
     """
-    def __init__(self, session: Session = None, default_country: Union[str, Country] = None):
+    def __init__(self, session: Session = None, default_country: Union[str, Country] = None, preload: bool = False):
         self._loading = True
+        self._preload = preload
         self.api = NagerRawAPI(session=session)
         data = self.api.get_version()
         self.name = data["name"]
         self.version = data["version"]
         self._countries = None
+        self._country_index = None
         self.default_country = self.country(default_country) if default_country else None # noqa
         self._loading = False
 
@@ -219,9 +308,11 @@ class NagerObjectAPI:
             country = self.default_country
         if not isinstance(country, Country):
             code = str(country).upper()
-            if code not in self.available_countries:
+            if self._country_index is None:
+                _ = self.available_countries
+            country = self._country_index.get(code)
+            if country is None:
                 raise NagerException(f"Invalid Country Code: {code}. Options: {[c for c in self.available_countries]}")
-            country = self.available_countries[self.available_countries.index(code)] # noqa
         if not country._full and load: # noqa
             country.load_details()
         return country
@@ -235,8 +326,19 @@ class NagerObjectAPI:
         """
         if self._countries is None:
             self._countries = [Country(self, c) for c in self.api.get_available_countries()]
+            self._country_index = {c._code_upper: c for c in self._countries}
+            if self._preload:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    list(executor.map(self._preload_country, self._countries))
         return self._countries
 
+    @staticmethod
+    def _preload_country(country):
+        try:
+            country.load_details()
+        except NagerException as e:
+            logger.warning(f"Failed to Preload {country.code}: {e}")
+
     def long_weekends(self, year: int, country: Union[Country, str] = None):
         """ All available :class:`~Weekend` Objects for a country in a given year.
 
@@ -267,6 +369,25 @@ class NagerObjectAPI:
         """
         return self.country(country, load=False).public_holidays(year)
 
+    def public_holidays_years(self, years: List[int], country: Union[Country, str] = None):
+        """ All available public :class:`~Holiday` Objects for a country in each of the given years, requested concurrently.
+
+            Parameters:
+                years (List[int]): Years to look at.
+                country (Union[Country, str]): ISO 3166-1 alpha-2 Country Code.
+
+            Returns:
+                Dict[int, List[:class:`~Holiday`]]
+
+            Raises:
+                :class:`NagerException`: When an Invalid Country Code or year is provided.
+        """
+        country = self.country(country, load=False)
+        if not years:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(8, len(years))) as executor:
+            return dict(zip(years, executor.map(country.public_holidays, years)))
+
     def is_today_public_holiday(self, country: Union[Country, str] = None, offset: int = None):
         """ Is today a public Holiday for the given country.
 
@@ -302,7 +423,7 @@ class NagerObjectAPI:
             Returns:
                 List[:class:`~Holiday`]
         """
-        return [Holiday(self, h) for h in self.api.get_next_public_worldwide_holidays()]
+        return Holiday._from_batch(self, self.api.get_next_public_worldwide_holidays())
 
 
 class NagerRawAPI:
@@ -312,37 +433,40 @@ class NagerRawAPI:
             session (Session): Use your own Session object.
     """
     def __init__(self, session: Session = None):
-        self._session = Session() if session is None else session
+        if session is None:
+            session = Session()
+            retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+            session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry))
+        self._session = session
+        self._cache = {}
 
     def _request(self, request_url, status_bool=False, **kwargs):
         """ process request. """
-        url_params = {}
-        for key, value in kwargs.items():
-            if value is not None:
-                url_params[key] = value
+        url_params = {k: v for k, v in kwargs.items() if v is not None} if kwargs else None
         logger.debug(f"Request URL: {request_url}")
         if url_params:
             logger.debug(f"Request Params: {url_params}")
         try:
-            self.response = self._session.get(request_url, params=url_params)
+            response = self._session.get(request_url, params=url_params)
         except RequestException as e:
             raise NagerException(f"Failed to Connect to {request_url}: {e}")
+        self.response = response
         if status_bool:
-            if self.response.status_code == 200:
+            if response.status_code == 200:
                 return True
-            elif self.response.status_code == 204:
+            elif response.status_code == 204:
                 return False
-        try:
-            response_json = self.response.json()
-        except JSONDecodeError as e:
-            raise NagerException(f"Failed to Decode Response JSON{request_url}: {e}\nContent: {self.response.content}")
-        logger.debug(f"Response ({self.response.status_code} [{self.response.reason}]) {response_json}")
+        return _process_response(request_url, response.status_code, response.reason, response.content)
+
+    def _cached_request(self, key, request_url):
+        """ process request and cache the response for the life of the object. """
+        if key not in self._cache:
+            self._cache[key] = self._request(request_url)
+        return self._cache[key]
 
-        if self.response.status_code == 404:
-            raise NagerException(f"({self.response.status_code} [{self.response.reason}]) Country Code Invalid")
-        elif self.response.status_code >= 400:
-            raise NagerException(f"({self.response.status_code} [{self.response.reason}]) {response_json}")
-        return response_json
+    def clear_cache(self):
+        """ Clears the cached responses of :meth:`get_country_info`, :meth:`get_available_countries`, and :meth:`get_version`. """
+        self._cache.clear()
 
     def get_country_info(self, country: str):
         """ `GET CountryInfo <https://date.nager.at/swagger/index.html>`__: Get country info for the given country.
@@ -356,7 +480,7 @@ class NagerRawAPI:
             Raises:
                 :class:`NagerException`: When an Invalid Country Code or year is provided.
         """
-        return self._request(f"{base_url}CountryInfo/{country}")
+        return self._cached_request(("CountryInfo", country), _country_info_url + country)
 
     def get_available_countries(self):
         """ `GET AvailableCountries <https://date.nager.at/swagger/index.html>`__: Get all available countries.
@@ -364,7 +488,7 @@ class NagerRawAPI:
             Returns:
                 List[Dict]
         """
-        return self._request(f"{base_url}AvailableCountries")
+        return self._cached_request("AvailableCountries", _available_countries_url)
 
     def get_long_weekend(self, year: int, country: str):
         """ `GET LongWeekend <https://date.nager.at/swagger/index.html>`__: Get long weekends for a given country
@@ -379,7 +503,7 @@ class NagerRawAPI:
             Raises:
                 :class:`NagerException`: When an Invalid Country Code or year is provided.
         """
-        return self._request(f"{base_url}LongWeekend/{year}/{country}")
+        return self._request(_long_weekend_url + str(year) + "/" + country)
 
     def get_public_holidays(self, year: int, country: str):
         """ `GET PublicHolidays <https://date.nager.at/swagger/index.html>`__: Get public holidays.
@@ -394,7 +518,7 @@ class NagerRawAPI:
             Raises:
                 :class:`NagerException`: When an Invalid Country Code or year is provided.
         """
-        return self._request(f"{base_url}PublicHolidays/{year}/{country}")
+        return self._request(_public_holidays_url + str(year) + "/" + country)
 
     def get_is_today_public_holiday(self, country: str, offset: int = None):
         """ `GET IsTodayPublicHoliday <https://date.nager.at/swagger/index.html>`__: Is today a public holiday.
@@ -410,7 +534,7 @@ class NagerRawAPI:
                 :class:`NagerException`: When an Invalid Country Code is provided.
         """
         params = {} if offset is None else {"offset": offset}
-        return self._request(f"{base_url}IsTodayPublicHoliday/{country}", status_bool=True, **params)
+        return self._request(_is_today_public_holiday_url + country, status_bool=True, **params)
 
     def get_next_public_holidays(self, country: str):
         """ `GET NextPublicHolidays <https://date.nager.at/swagger/index.html>`__: Returns the upcoming public holidays for the next 365 days for the given country.
@@ -424,7 +548,7 @@ class NagerRawAPI:
             Raises:
                 :class:`NagerException`: When an Invalid Country Code is provided.
         """
-        return self._request(f"{base_url}NextPublicHolidays/{country}")
+        return self._request(_next_public_holidays_url + country)
 
     def get_next_public_worldwide_holidays(self):
         """ `GET NextPublicHolidaysWorldwide <https://date.nager.at/swagger/index.html>`__: Returns the upcoming public holidays for the next 7 days.
@@ -432,7 +556,7 @@ class NagerRawAPI:
             Returns:
                 List[Dict]
         """
-        return self._request(f"{base_url}NextPublicHolidaysWorldwide")
+        return self._request(_next_public_worldwide_holidays_url)
 
     def get_version(self):
         """ `GET Version <https://date.nager.at/swagger/index.html>`__: Get version of the used Nager.Date library.
@@ -440,4 +564,99 @@ class NagerRawAPI:
             Returns:
                 Dict
         """
-        return self._request(f"{base_url}Version")
+        return self._cached_request("Version", _version_url)
+
+
+class NagerAsyncRawAPI:
+    """ Async Raw API Class for running many requests concurrently. Requires ``httpx``.
+
+        Parameters:
+            client (httpx.AsyncClient): Use your own AsyncClient object.
+            max_connections (int): Maximum number of requests the bulk methods run at once.
+
+        Raises:
+            :class:`NagerException`: When ``httpx`` is not installed.
+    """
+    def __init__(self, client: "httpx.AsyncClient" = None, max_connections: int = 10):
+        if httpx is None:
+            raise NagerException("httpx must be installed to use NagerAsyncRawAPI")
+        self._max_connections = max_connections
+        self._owns_client = client is None
+        self._client = httpx.AsyncClient() if client is None else client
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """ Closes the underlying AsyncClient when it was created by this object. """
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def _request(self, request_url):
+        """ process request. """
+        logger.debug(f"Request URL: {request_url}")
+        try:
+            response = await self._client.get(request_url)
+        except httpx.HTTPError as e:
+            raise NagerException(f"Failed to Connect to {request_url}: {e}")
+        return _process_response(request_url, response.status_code, response.reason_phrase, response.content)
+
+    async def _gather(self, func, args_list):
+        """ Runs func for each args tuple with at most max_connections running at once, cancelling the rest if one fails. """
+        semaphore = asyncio.Semaphore(self._max_connections)
+
+        async def limited(args):
+            async with semaphore:
+                return await func(*args)
+
+        tasks = [asyncio.ensure_future(limited(args)) for args in args_list]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def get_country_info(self, country: str):
+        """ Async version of :meth:`NagerRawAPI.get_country_info`. """
+        return await self._request(_country_info_url + country)
+
+    async def get_public_holidays(self, year: int, country: str):
+        """ Async version of :meth:`NagerRawAPI.get_public_holidays`. """
+        return await self._request(_public_holidays_url + str(year) + "/" + country)
+
+    async def get_country_info_bulk(self, countries: List[str]):
+        """ Gets the country info for every given country concurrently.
+
+            Parameters:
+                countries (List[str]): ISO 3166-1 alpha-2 Country Codes.
+
+            Returns:
+                Dict[str, Dict]: Country Info keyed by Country Code.
+
+            Raises:
+                :class:`NagerException`: When an Invalid Country Code is provided.
+        """
+        results = await self._gather(self.get_country_info, [(c,) for c in countries])
+        return dict(zip(countries, results))
+
+    async def get_public_holidays_bulk(self, years: List[int], countries: List[str]):
+        """ Gets the public holidays for every given year and country combination concurrently.
+
+            Parameters:
+                years (List[int]): Years to look at.
+                countries (List[str]): ISO 3166-1 alpha-2 Country Codes.
+
+            Returns:
+                Dict[Tuple[int, str], List[Dict]]: Public Holidays keyed by (year, Country Code).
+
+            Raises:
+                :class:`NagerException`: When an Invalid Country Code or year is provided.
+        """
+        keys = [(y, c) for y in years for c in countries]
+        results = await self._gather(self.get_public_holidays, keys)
+        return dict(zip(keys, results))
@@ -25,11 +25,15 @@ setup(
     author_email=nagerapi.__email__,
     license=nagerapi.__license__,
     packages=find_packages(),
-    python_requires=">=3.6",
+    python_requires=">=3.8",
     keywords=["nagerapi", "nager", "wrapper", "api"],
     install_requires=[
         "requests"
     ],
+    extras_require={
+        "async": ["httpx"],
+        "fast": ["orjson"]
+    },
     project_urls={
         "Documentation": "https://nagerapi.metamanager.wiki",
         "Funding": "https://github.com/sponsors/meisnate12",
@@ -41,8 +45,6 @@ setup(
         "Intended Audience :: Developers",
         "Topic :: Software Development :: Libraries",
         "Programming Language :: Python",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
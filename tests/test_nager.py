@@ -1,6 +1,6 @@
-import unittest
+import asyncio, copy, unittest
 from datetime import datetime
-from nagerapi import NagerObjectAPI, NagerException
+from nagerapi import NagerObjectAPI, NagerAsyncRawAPI, NagerException
 
 """
 import logging
@@ -53,6 +53,16 @@ class NagerTests(unittest.TestCase):
         self.assertRaises(AttributeError, attr_check)
         self.assertIn(us, self.nager.available_countries)
 
+    def test_preload(self):
+        nager = NagerObjectAPI(preload=True)
+        self.assertTrue(all(c._full for c in nager.available_countries))
+
+    def test_borders(self):
+        us = self.nager.country("US")
+        ca = us.borders[us.borders.index("CA")]
+        self.assertIs(ca, self.nager.country("CA", load=False))
+        self.assertIn("US", ca.borders)
+
     def test_long_weekend(self):
         weekends = self.nager.long_weekends(datetime.now().year)
         self.assertGreater(len(weekends), 0)
@@ -63,6 +73,27 @@ class NagerTests(unittest.TestCase):
         self.assertGreater(len(holidays), 0)
         self.assertIn(holidays[0].name, f"{holidays[0]}")
 
+    def test_public_holidays_years(self):
+        year = datetime.now().year
+        holidays = self.nager.public_holidays_years([year - 1, year])
+        self.assertEqual(list(holidays), [year - 1, year])
+        self.assertGreater(len(holidays[year]), 0)
+        self.assertEqual(holidays[year][0].date.year, year)
+
+    def test_copy(self):
+        holiday = self.nager.public_holidays(datetime.now().year)[0]
+        weekend = self.nager.long_weekends(datetime.now().year)[0]
+        country = self.nager.country("US")
+        for obj in (holiday, weekend, country):
+            obj_copy = copy.copy(obj)
+            self.assertIsNot(obj_copy, obj)
+            self.assertEqual(f"{obj_copy}", f"{obj}")
+        self.assertEqual(copy.copy(holiday).date, holiday.date)
+        self.assertEqual(copy.copy(country), country)
+        def attr_check():
+            copy.copy(holiday).name = "Bob"
+        self.assertRaises(AttributeError, attr_check)
+
     def test_is_today_public_holiday(self):
         now = datetime.now()
         us = self.nager.country()
@@ -82,5 +113,16 @@ class NagerTests(unittest.TestCase):
     def test_next_public_world_holiday(self):
         self.assertGreater(len(self.nager.next_public_worldwide_holidays()), 0)
 
+    def test_async_public_holidays_bulk(self):
+        async def bulk():
+            async with NagerAsyncRawAPI() as api:
+                return await api.get_public_holidays_bulk([2023, 2024], ["US", "CA"])
+        holidays = asyncio.run(bulk())
+        self.assertEqual(len(holidays), 4)
+        self.assertGreater(len(holidays[(2024, "CA")]), 0)
+
     def test_version(self):
         self.assertEqual(self.nager.name, "Nager.Date")
+        self.assertIs(self.nager.api.get_version(), self.nager.api.get_version())
+        self.nager.api.clear_cache()
+        self.assertEqual(self.nager.api.get_version()["name"], "Nager.Date")